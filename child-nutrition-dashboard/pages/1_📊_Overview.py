@@ -24,6 +24,7 @@ from utils.data_queries import (
     get_key_metrics, get_stunting_category_data, get_temporal_trends_data,
     get_top_sites_data, get_program_distribution_data, get_z_score_distribution_data
 )
+from utils.cache import bump_data_version
 
 # Page configuration
 st.set_page_config(
@@ -274,6 +275,7 @@ def main():
     # Data refresh button
     if st.button("🔄 Refresh Data"):
         st.cache_data.clear()
+        bump_data_version()
         st.experimental_rerun()
 
 if __name__ == "__main__":
@@ -15,13 +15,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.data_queries import (
     get_available_sites,
-    get_site_rankings,
-    get_site_temporal_data,
-    get_site_category_data,
-    get_site_status_distribution,
-    get_z_score_comparison_data,
-    get_stunting_comparison_data,
-    get_measurement_volume_data
+    load_site_bundle
 )
 from utils.components import (
     create_ranking_card,
@@ -93,8 +87,9 @@ def main():
         # Load site data
         with st.spinner(f"Loading data for {selected_site}..."):
             try:
-                # Get site rankings
-                site_rankings = get_site_rankings(selected_site)
+                # Load all site data (queries run concurrently)
+                site_data = load_site_bundle(selected_site)
+                site_rankings = site_data['rankings']
                 
                 # Site summary card removed as requested
                 
@@ -155,7 +150,7 @@ def main():
                 # Chart 1: Nutrition Outcomes Over Time
                 st.markdown("#### Chart 1: Nutrition Outcomes Over Time")
                 
-                temporal_data = get_site_temporal_data(selected_site)
+                temporal_data = site_data['temporal']
                 temporal_chart = create_site_temporal_chart(temporal_data)
                 st.plotly_chart(temporal_chart, use_container_width=True)
                 
@@ -168,7 +163,7 @@ def main():
                 # Chart 2: Number of Children by Category
                 st.markdown("#### Chart 2: Number of Children by Category")
                 
-                category_data = get_site_category_data(selected_site)
+                category_data = site_data['category']
                 category_chart = create_stunting_progress_chart(category_data, "count")
                 st.plotly_chart(category_chart, use_container_width=True)
                 
@@ -181,7 +176,7 @@ def main():
                 # Chart 3: Current Status Distribution
                 st.markdown("#### Chart 3: Current Status Distribution")
                 
-                status_data = get_site_status_distribution(selected_site)
+                status_data = site_data['status']
                 status_chart = create_site_status_distribution_chart(status_data)
                 st.plotly_chart(status_chart, use_container_width=True)
                 
@@ -200,7 +195,7 @@ def main():
                     # Chart 4: Z-Score Comparison
                     st.markdown("#### Chart 4: Z-Score Comparison Across Locations")
                     
-                    zscore_comparison_data = get_z_score_comparison_data(selected_site)
+                    zscore_comparison_data = site_data['zscore_comparison']
                     zscore_comparison_chart = create_z_score_comparison_chart(zscore_comparison_data, selected_site)
                     st.plotly_chart(zscore_comparison_chart, use_container_width=True)
                     
@@ -212,7 +207,7 @@ def main():
                     # Chart 5: Stunting Rate Comparison
                     st.markdown("#### Chart 5: Stunting Rate Comparison")
                     
-                    stunting_comparison_data = get_stunting_comparison_data(selected_site)
+                    stunting_comparison_data = site_data['stunting_comparison']
                     stunting_comparison_chart = create_stunting_comparison_chart(stunting_comparison_data, selected_site)
                     st.plotly_chart(stunting_comparison_chart, use_container_width=True)
                     
@@ -225,7 +220,7 @@ def main():
                 # Chart 6: Measurement Volume Over Time
                 st.markdown("#### Chart 6: Measurement Volume Over Time")
                 
-                volume_data = get_measurement_volume_data(selected_site)
+                volume_data = site_data['volume']
                 volume_chart = create_measurement_volume_chart(volume_data)
                 st.plotly_chart(volume_chart, use_container_width=True)
                 
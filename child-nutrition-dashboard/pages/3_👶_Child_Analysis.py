@@ -15,9 +15,9 @@ from utils.data_queries import (
     get_available_children_for_site,
     get_child_profile_data,
     get_child_progress_metrics,
-    get_child_growth_trajectory,
-    get_child_z_score_progression,
-    get_child_measurement_history
+    get_child_growth_trajectory_df,
+    get_child_z_score_progression_df,
+    get_child_measurement_history_df
 )
 from utils.components import (
     create_child_profile_card,
@@ -187,8 +187,8 @@ def main():
                         
                         with col1:
                             st.markdown("#### 📈 Height Growth Trajectory")
-                            growth_data = get_child_growth_trajectory(child_id)
-                            if growth_data:
+                            growth_data = get_child_growth_trajectory_df(child_id)
+                            if not growth_data.empty:
                                 growth_chart = create_growth_trajectory_chart(growth_data)
                                 st.plotly_chart(growth_chart, use_container_width=True)
                                 
@@ -200,8 +200,8 @@ def main():
                         
                         with col2:
                             st.markdown("#### 📊 Z-Score Progression")
-                            zscore_data = get_child_z_score_progression(child_id)
-                            if zscore_data:
+                            zscore_data = get_child_z_score_progression_df(child_id)
+                            if not zscore_data.empty:
                                 zscore_chart = create_z_score_progression_chart(zscore_data)
                                 st.plotly_chart(zscore_chart, use_container_width=True)
                                 
@@ -215,8 +215,8 @@ def main():
                         st.markdown("---")
                         st.subheader("📋 Measurement History & AI Summary")
                         
-                        measurement_history = get_child_measurement_history(child_id)
-                        if measurement_history:
+                        measurement_history = get_child_measurement_history_df(child_id)
+                        if not measurement_history.empty:
                             create_measurement_history_table(measurement_history)
                             
                             # AI Summary button placeholder
@@ -0,0 +1,7 @@
+-- Precompute the quarter bucket used by the temporal trend queries.
+-- GROUP BY CAPTURE_QUARTER avoids evaluating DATE_TRUNC on every scanned row.
+ALTER TABLE CHILD_NUTRITION_DATA
+    ADD COLUMN CAPTURE_QUARTER DATE AS (DATE_TRUNC('quarter', CAPTURE_DATE));
+
+-- Keep micro-partitions ordered by date so the 5-year window prunes well.
+ALTER TABLE CHILD_NUTRITION_DATA CLUSTER BY (CAPTURE_DATE);
@@ -0,0 +1,12 @@
+-- Store DUPLICATE as BOOLEAN instead of the 'True'/'False' strings so the
+-- filter is a one-byte test and micro-partition min/max pruning applies.
+-- Anything other than exactly 'False' was excluded by the old
+-- DUPLICATE = 'False' filter, so it maps to TRUE to keep the same rows.
+ALTER TABLE CHILD_NUTRITION_DATA ADD COLUMN DUPLICATE_B BOOLEAN;
+UPDATE CHILD_NUTRITION_DATA SET DUPLICATE_B = (DUPLICATE <> 'False');
+ALTER TABLE CHILD_NUTRITION_DATA DROP COLUMN DUPLICATE;
+ALTER TABLE CHILD_NUTRITION_DATA RENAME COLUMN DUPLICATE_B TO DUPLICATE;
+
+-- Keep the rows every dashboard query reads (DUPLICATE = FALSE, FLAGGED = 0)
+-- in contiguous micro-partitions.
+ALTER TABLE CHILD_NUTRITION_DATA CLUSTER BY (DUPLICATE, FLAGGED, CAPTURE_DATE);
@@ -0,0 +1,16 @@
+-- Pre-filtered projection of the measurement table used by the overview and
+-- location queries. Rows flagged for data quality or marked as duplicates are
+-- removed once here instead of on every dashboard query.
+CREATE OR REPLACE MATERIALIZED VIEW SITE_NUTRITION_CLEAN
+    CLUSTER BY (SITE, CAPTURE_DATE)
+AS
+SELECT
+    SITE,
+    SITE_GROUP,
+    BENEFICIARY_ID,
+    HOUSEHOLD_ID,
+    WHO_INDEX,
+    CAPTURE_DATE,
+    CAPTURE_QUARTER
+FROM CHILD_NUTRITION_DATA
+WHERE FLAGGED = 0 AND DUPLICATE = FALSE;
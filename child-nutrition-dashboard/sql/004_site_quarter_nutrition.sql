@@ -0,0 +1,23 @@
+-- Per-site, per-quarter metrics for the location page temporal charts.
+-- These only change when new measurements are loaded, so they are rebuilt
+-- nightly instead of being aggregated from raw rows on every page render.
+CREATE OR REPLACE TASK REFRESH_SITE_QUARTER_NUTRITION
+    USER_TASK_MANAGED_INITIAL_WAREHOUSE_SIZE = 'XSMALL'
+    SCHEDULE = 'USING CRON 0 2 * * * UTC'
+AS
+CREATE OR REPLACE TABLE SITE_QUARTER_NUTRITION AS
+SELECT
+    SITE,
+    CAPTURE_QUARTER AS QUARTER,
+    COUNT(*) AS MEASUREMENT_COUNT,
+    AVG(WHO_INDEX) AS AVG_Z_SCORE,
+    SUM(IFF(WHO_INDEX BETWEEN -3 AND -2, 1, 0)) * 100.0 / COUNT(*) AS STUNTING_RATE,
+    SUM(IFF(WHO_INDEX < -3, 1, 0)) * 100.0 / COUNT(*) AS SEVERE_STUNTING_RATE
+FROM SITE_NUTRITION_CLEAN
+GROUP BY SITE, CAPTURE_QUARTER;
+
+ALTER TASK REFRESH_SITE_QUARTER_NUTRITION RESUME;
+
+-- Build the table now rather than waiting for the first scheduled run.
+-- The run is asynchronous; check TASK_HISTORY before deploying the dashboard.
+EXECUTE TASK REFRESH_SITE_QUARTER_NUTRITION;
@@ -0,0 +1,18 @@
+-- One row per site for the location dropdown. Child counts are approximate
+-- and only change when new data is loaded, so the table is rebuilt nightly.
+CREATE OR REPLACE TASK REFRESH_SITE_DIM
+    USER_TASK_MANAGED_INITIAL_WAREHOUSE_SIZE = 'XSMALL'
+    SCHEDULE = 'USING CRON 0 2 * * * UTC'
+AS
+CREATE OR REPLACE TABLE SITE_DIM AS
+SELECT
+    SITE,
+    APPROX_COUNT_DISTINCT(BENEFICIARY_ID) AS CHILD_COUNT
+FROM SITE_NUTRITION_CLEAN
+GROUP BY SITE;
+
+ALTER TASK REFRESH_SITE_DIM RESUME;
+
+-- Build the table now rather than waiting for the first scheduled run.
+-- The run is asynchronous; check TASK_HISTORY before deploying the dashboard.
+EXECUTE TASK REFRESH_SITE_DIM;
@@ -0,0 +1,17 @@
+-- Pre-filtered projection of the measurement table used by the child page.
+-- Clustering on (SITE, BENEFICIARY_ID) keeps a site's children and each
+-- child's measurements in a narrow range of micro-partitions.
+CREATE OR REPLACE MATERIALIZED VIEW CND_CLEAN
+    CLUSTER BY (SITE, BENEFICIARY_ID)
+AS
+SELECT
+    BENEFICIARY_ID,
+    FIRST_NAMES,
+    LAST_NAME,
+    HOUSEHOLD,
+    SITE,
+    CAPTURE_DATE,
+    ANSWER,
+    WHO_INDEX
+FROM CHILD_NUTRITION_DATA
+WHERE FLAGGED = 0 AND DUPLICATE = FALSE;
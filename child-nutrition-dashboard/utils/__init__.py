@@ -11,6 +11,7 @@ from .database import (
     test_connection,
     close_all_connections
 )
+from .cache import ttl_cache, bump_data_version
 
 __all__ = [
     'DatabaseConnection',
@@ -18,5 +19,7 @@ __all__ = [
     'execute_query',
     'execute_query_with_retry',
     'test_connection',
-    'close_all_connections'
+    'close_all_connections',
+    'ttl_cache',
+    'bump_data_version'
 ]
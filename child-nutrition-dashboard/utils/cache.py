@@ -0,0 +1,81 @@
+"""
+Cache Module for Child Nutrition Dashboard
+Provides an in-process TTL cache for warehouse query results.
+"""
+
+import copy
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable
+
+import pandas as pd
+
+# Epoch included in every cache key; bump it when the ETL load finishes so
+# cached results from the previous load are never served again.
+_data_version = 0
+_lock = threading.Lock()
+
+def bump_data_version() -> int:
+    """
+    Invalidate all TTL-cached results by advancing the data version.
+
+    Returns:
+        int: The new data version
+    """
+    global _data_version
+    with _lock:
+        _data_version += 1
+        return _data_version
+
+def _copy_value(value: Any) -> Any:
+    """Copy mutable results so callers cannot modify the cached value."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+def ttl_cache(seconds: int = 300) -> Callable:
+    """
+    Cache a function's results per argument set for a fixed time.
+
+    Args:
+        seconds: Time-to-live for each cached entry
+
+    Returns:
+        Decorator that adds caching and a cache_clear() method
+    """
+    def decorator(func: Callable) -> Callable:
+        entries = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_data_version, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with _lock:
+                entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                return _copy_value(entry[1])
+
+            value = func(*args, **kwargs)
+
+            with _lock:
+                # Drop expired entries and ones from older data versions
+                for stale_key in [k for k, (expiry, _) in entries.items()
+                                  if expiry <= now or k[0] != _data_version]:
+                    del entries[stale_key]
+                entries[key] = (now + seconds, _copy_value(value))
+
+            return value
+
+        def cache_clear():
+            """Remove all cached entries for this function."""
+            with _lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -9,7 +9,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 
 # Color palette matching the mockup
@@ -1165,23 +1165,23 @@ def create_alert_banner(alert_type: str, title: str, message: str) -> None:
         print(f"Error in create_alert_banner: {e}")
         st.error("Error creating alert banner")
 
-def create_growth_trajectory_chart(data: List[Dict]) -> go.Figure:
+def create_growth_trajectory_chart(data: Union[pd.DataFrame, List[Dict]]) -> go.Figure:
     """
     Create height growth trajectory chart for a specific child.
     
     Args:
-        data: List of measurement data over time
+        data: Measurement data over time, as a DataFrame or list of records
     
     Returns:
         Plotly figure object
     """
     try:
-        if not data:
+        if len(data) == 0:
             return create_empty_chart("Height Growth Trajectory", "No data available")
         
-        # Convert data to DataFrame
+        # Parse dates on a new frame so a cached input is never modified
         df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
+        df = df.assign(date=pd.to_datetime(df['date']))
         
         # Create figure
         fig = go.Figure()
@@ -1240,23 +1240,23 @@ def create_growth_trajectory_chart(data: List[Dict]) -> go.Figure:
         print(f"Error in create_growth_trajectory_chart: {e}")
         return create_empty_chart("Height Growth Trajectory", "Error loading chart")
 
-def create_z_score_progression_chart(data: List[Dict]) -> go.Figure:
+def create_z_score_progression_chart(data: Union[pd.DataFrame, List[Dict]]) -> go.Figure:
     """
     Create z-score progression chart with WHO reference lines.
     
     Args:
-        data: List of z-score data over time
+        data: Z-score data over time, as a DataFrame or list of records
     
     Returns:
         Plotly figure object
     """
     try:
-        if not data:
+        if len(data) == 0:
             return create_empty_chart("Z-Score Progression", "No data available")
         
-        # Convert data to DataFrame
+        # Parse dates on a new frame so a cached input is never modified
         df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
+        df = df.assign(date=pd.to_datetime(df['date']))
         
         # Create figure
         fig = go.Figure()
@@ -1313,19 +1313,18 @@ def create_z_score_progression_chart(data: List[Dict]) -> go.Figure:
         print(f"Error in create_z_score_progression_chart: {e}")
         return create_empty_chart("Z-Score Progression", "Error loading chart")
 
-def create_measurement_history_table(data: List[Dict]) -> None:
+def create_measurement_history_table(data: Union[pd.DataFrame, List[Dict]]) -> None:
     """
     Create a styled measurement history table.
     
     Args:
-        data: List of measurement history data
+        data: Measurement history, as a DataFrame or list of records
     """
     try:
-        if not data:
+        if len(data) == 0:
             st.warning("No measurement history available")
             return
         
-        # Convert to DataFrame
         df = pd.DataFrame(data)
         
         # Style the DataFrame
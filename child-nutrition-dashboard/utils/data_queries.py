@@ -7,7 +7,27 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from .database import get_database
+from concurrent.futures import ThreadPoolExecutor
+from .database import DatabaseConnection, get_database
+from .cache import ttl_cache
+
+def _coerce(df: pd.DataFrame, columns: Dict[str, Tuple[str, Optional[str]]]) -> pd.DataFrame:
+    """
+    Rename query result columns and cast only those not already in the target dtype.
+    
+    Args:
+        df: Raw query result
+        columns: Mapping of output column to (source column, dtype or None)
+    
+    Returns:
+        DataFrame with only the output columns, in mapping order
+    """
+    df = df.rename(columns={source: name for name, (source, _) in columns.items()}, copy=False)
+    casts = {name: dtype for name, (_, dtype) in columns.items()
+             if dtype is not None and df[name].dtype != dtype}
+    if casts:
+        df = df.astype(casts, copy=False)
+    return df[list(columns)]
 
 def get_key_metrics() -> Dict[str, any]:
     """
@@ -20,14 +40,10 @@ def get_key_metrics() -> Dict[str, any]:
     db = get_database()
     
     try:
-        # Test connection first
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
         # Total Children Measured
         total_children_query = """
         SELECT COUNT(DISTINCT BENEFICIARY_ID) as total_children
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        FROM SITE_NUTRITION_CLEAN
         """
         total_children_df = db.execute_query(total_children_query)
         total_children = total_children_df.iloc[0]['TOTAL_CHILDREN'] if not total_children_df.empty else 0
@@ -35,8 +51,7 @@ def get_key_metrics() -> Dict[str, any]:
         # Active Sites
         active_sites_query = """
         SELECT COUNT(DISTINCT SITE) as active_sites
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        FROM SITE_NUTRITION_CLEAN
         """
         active_sites_df = db.execute_query(active_sites_query)
         active_sites = active_sites_df.iloc[0]['ACTIVE_SITES'] if not active_sites_df.empty else 0
@@ -44,8 +59,7 @@ def get_key_metrics() -> Dict[str, any]:
         # Average WHO Z-Score
         avg_zscore_query = """
         SELECT ROUND(AVG(WHO_INDEX), 2) as avg_z_score
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        FROM SITE_NUTRITION_CLEAN
         """
         avg_zscore_df = db.execute_query(avg_zscore_query)
         avg_zscore = avg_zscore_df.iloc[0]['AVG_Z_SCORE'] if not avg_zscore_df.empty else 0
@@ -53,16 +67,14 @@ def get_key_metrics() -> Dict[str, any]:
         # Stunting Reduction (first vs last measurement)
         stunting_reduction_query = """
         WITH first_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+            SELECT BENEFICIARY_ID, WHO_INDEX
+            FROM SITE_NUTRITION_CLEAN
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) = 1
         ),
         last_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+            SELECT BENEFICIARY_ID, WHO_INDEX
+            FROM SITE_NUTRITION_CLEAN
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) = 1
         ),
         stunting_rates AS (
             SELECT 
@@ -70,7 +82,6 @@ def get_key_metrics() -> Dict[str, any]:
                 AVG(CASE WHEN l.WHO_INDEX < -2 THEN 1.0 ELSE 0.0 END) as last_stunting_rate
             FROM first_measurements f
             JOIN last_measurements l ON f.BENEFICIARY_ID = l.BENEFICIARY_ID
-            WHERE f.rn = 1 AND l.rn = 1
         )
         SELECT ROUND((first_stunting_rate - last_stunting_rate) * 100, 1) as stunting_reduction
         FROM stunting_rates
@@ -101,17 +112,15 @@ def get_stunting_category_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
     try:
         # Get stunting category progress data
         query = """
-        WITH         first_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        WITH first_measurements AS (
+            SELECT BENEFICIARY_ID, WHO_INDEX
+            FROM SITE_NUTRITION_CLEAN
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) = 1
         ),
         last_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+            SELECT BENEFICIARY_ID, WHO_INDEX
+            FROM SITE_NUTRITION_CLEAN
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) = 1
         ),
         category_classification AS (
             SELECT 
@@ -120,7 +129,7 @@ def get_stunting_category_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
                 SUM(CASE WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 1 ELSE 0 END) as stunted,
                 SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) as severely_stunted,
                 COUNT(*) as total
-            FROM first_measurements WHERE rn = 1
+            FROM first_measurements
             UNION ALL
             SELECT 
                 'Last Measurement' as period,
@@ -128,7 +137,7 @@ def get_stunting_category_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
                 SUM(CASE WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 1 ELSE 0 END) as stunted,
                 SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) as severely_stunted,
                 COUNT(*) as total
-            FROM last_measurements WHERE rn = 1
+            FROM last_measurements
         )
         SELECT * FROM category_classification
         """
@@ -138,17 +147,17 @@ def get_stunting_category_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
         if df.empty:
             raise Exception("No stunting category data found in database")
         else:
-            # Process real data - convert decimal types to float
+            # Process real data
             percentage_data = df.copy()
-            percentage_data['at_risk'] = (percentage_data['AT_RISK'].astype(float) / percentage_data['TOTAL'].astype(float) * 100).round(1)
-            percentage_data['stunted'] = (percentage_data['STUNTED'].astype(float) / percentage_data['TOTAL'].astype(float) * 100).round(1)
-            percentage_data['severely_stunted'] = (percentage_data['SEVERELY_STUNTED'].astype(float) / percentage_data['TOTAL'].astype(float) * 100).round(1)
+            percentage_data['at_risk'] = (percentage_data['AT_RISK'] / percentage_data['TOTAL'] * 100).round(1)
+            percentage_data['stunted'] = (percentage_data['STUNTED'] / percentage_data['TOTAL'] * 100).round(1)
+            percentage_data['severely_stunted'] = (percentage_data['SEVERELY_STUNTED'] / percentage_data['TOTAL'] * 100).round(1)
             percentage_data['category'] = percentage_data['PERIOD']
             
             count_data = df.copy()
-            count_data['at_risk'] = percentage_data['AT_RISK'].astype(int)
-            count_data['stunted'] = percentage_data['STUNTED'].astype(int)
-            count_data['severely_stunted'] = percentage_data['SEVERELY_STUNTED'].astype(int)
+            count_data['at_risk'] = percentage_data['AT_RISK']
+            count_data['stunted'] = percentage_data['STUNTED']
+            count_data['severely_stunted'] = percentage_data['SEVERELY_STUNTED']
             count_data['category'] = percentage_data['PERIOD']
             
             # Add target goals
@@ -187,14 +196,13 @@ def get_temporal_trends_data() -> pd.DataFrame:
     try:
         query = """
         SELECT 
-            DATE_TRUNC('quarter', CAPTURE_DATE) as quarter,
+            CAPTURE_QUARTER as quarter,
             COUNT(*) as measurement_count,
             AVG(WHO_INDEX) as avg_z_score,
             SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as stunting_rate
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-            AND CAPTURE_DATE >= DATEADD(year, -5, CURRENT_DATE())
-        GROUP BY DATE_TRUNC('quarter', CAPTURE_DATE)
+        FROM SITE_NUTRITION_CLEAN
+        WHERE CAPTURE_DATE >= DATEADD(year, -5, CURRENT_DATE())
+        GROUP BY CAPTURE_QUARTER
         ORDER BY quarter
         """
         
@@ -203,13 +211,13 @@ def get_temporal_trends_data() -> pd.DataFrame:
         if df.empty:
             raise Exception("No temporal trends data found in database")
         else:
-            # Process real data - convert decimal types to float
-            df['period'] = df['QUARTER'].astype(str)
-            df['measurements'] = df['MEASUREMENT_COUNT'].astype(int)
-            df['avg_z_score'] = df['AVG_Z_SCORE'].astype(float).round(2)
-            df['stunting_rate'] = df['STUNTING_RATE'].astype(float).round(1)
-            
-            return df[['period', 'measurements', 'avg_z_score', 'stunting_rate']]
+            # Process real data
+            return _coerce(df, {
+                'period': ('QUARTER', 'str'),
+                'measurements': ('MEASUREMENT_COUNT', 'int64'),
+                'avg_z_score': ('AVG_Z_SCORE', 'float64'),
+                'stunting_rate': ('STUNTING_RATE', 'float64')
+            }).round({'avg_z_score': 2, 'stunting_rate': 1})
             
     except Exception as e:
         raise Exception(f"Failed to load temporal trends data from database: {str(e)}")
@@ -230,8 +238,7 @@ def get_top_sites_data() -> pd.DataFrame:
             SITE,
             COUNT(DISTINCT BENEFICIARY_ID) as children_count,
             ROUND(COUNT(DISTINCT BENEFICIARY_ID) * 100.0 / SUM(COUNT(DISTINCT BENEFICIARY_ID)) OVER (), 1) as percentage
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        FROM SITE_NUTRITION_CLEAN
         GROUP BY SITE
         ORDER BY children_count DESC
         LIMIT 10
@@ -242,12 +249,12 @@ def get_top_sites_data() -> pd.DataFrame:
         if df.empty:
             raise Exception("No top sites data found in database")
         else:
-            # Process real data - convert decimal types to float
-            df['site'] = df['SITE']
-            df['children_count'] = df['CHILDREN_COUNT'].astype(int)
-            df['percentage'] = df['PERCENTAGE'].astype(float)
-            
-            return df[['site', 'children_count', 'percentage']]
+            # Process real data
+            return _coerce(df, {
+                'site': ('SITE', None),
+                'children_count': ('CHILDREN_COUNT', 'int64'),
+                'percentage': ('PERCENTAGE', 'float64')
+            })
             
     except Exception as e:
         raise Exception(f"Failed to load top sites data from database: {str(e)}")
@@ -268,8 +275,7 @@ def get_program_distribution_data() -> pd.DataFrame:
             SITE_GROUP,
             COUNT(DISTINCT BENEFICIARY_ID) as children_count,
             ROUND(COUNT(DISTINCT BENEFICIARY_ID) * 100.0 / SUM(COUNT(DISTINCT BENEFICIARY_ID)) OVER (), 1) as percentage
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        FROM SITE_NUTRITION_CLEAN
         GROUP BY SITE_GROUP
         ORDER BY children_count DESC
         """
@@ -279,12 +285,12 @@ def get_program_distribution_data() -> pd.DataFrame:
         if df.empty:
             raise Exception("No program distribution data found in database")
         else:
-            # Process real data - convert decimal types to float
-            df['site_group'] = df['SITE_GROUP']
-            df['percentage'] = df['PERCENTAGE'].astype(float)
-            df['children_count'] = df['CHILDREN_COUNT'].astype(int)
-            
-            return df[['site_group', 'percentage', 'children_count']]
+            # Process real data
+            return _coerce(df, {
+                'site_group': ('SITE_GROUP', None),
+                'percentage': ('PERCENTAGE', 'float64'),
+                'children_count': ('CHILDREN_COUNT', 'int64')
+            })
             
     except Exception as e:
         raise Exception(f"Failed to load program distribution data from database: {str(e)}")
@@ -305,9 +311,8 @@ def get_z_score_distribution_data() -> pd.DataFrame:
             SELECT 
                 FLOOR(WHO_INDEX * 2) / 2 as z_score_bin,
                 COUNT(*) as frequency
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-                AND WHO_INDEX BETWEEN -6 AND 6
+            FROM SITE_NUTRITION_CLEAN
+            WHERE WHO_INDEX BETWEEN -6 AND 6
             GROUP BY FLOOR(WHO_INDEX * 2) / 2
         )
         SELECT z_score_bin, frequency
@@ -320,11 +325,11 @@ def get_z_score_distribution_data() -> pd.DataFrame:
         if df.empty:
             raise Exception("No z-score distribution data found in database")
         else:
-            # Process real data - convert decimal types to float
-            df['z_score_bin'] = df['Z_SCORE_BIN'].astype(float)
-            df['frequency'] = df['FREQUENCY'].astype(int)
-            
-            return df[['z_score_bin', 'frequency']]
+            # Process real data
+            return _coerce(df, {
+                'z_score_bin': ('Z_SCORE_BIN', 'float64'),
+                'frequency': ('FREQUENCY', 'int64')
+            })
             
     except Exception as e:
         raise Exception(f"Failed to load z-score distribution data from database: {str(e)}")
@@ -333,6 +338,39 @@ def get_z_score_distribution_data() -> pd.DataFrame:
 # LOCATION ANALYSIS PAGE QUERIES
 # ============================================================================
 
+# SQL text is built once at import; functions only bind parameters per call.
+
+# Null replacements and target dtypes for the site summary row
+_SUMMARY_DEFAULTS = {
+    'SITE': 'Unknown Site',
+    'CLEAN_SITE_GROUP': '',
+    'TOTAL_CHILDREN': 0,
+    'TOTAL_HOUSEHOLDS': 0,
+    'TOTAL_MEASUREMENTS': 0,
+    'AVG_Z_SCORE': 0.0,
+    'STUNTING_RATE': 0.0
+}
+
+_SUMMARY_DTYPES = {
+    'SITE': 'str',
+    'CLEAN_SITE_GROUP': 'str',
+    'TOTAL_CHILDREN': 'int64',
+    'TOTAL_HOUSEHOLDS': 'int64',
+    'TOTAL_MEASUREMENTS': 'int64',
+    'AVG_Z_SCORE': 'float64',
+    'STUNTING_RATE': 'float64'
+}
+
+# SITE_DIM (sql/005) holds one row per site with an approximate child count
+_Q_AVAILABLE_SITES = """
+SELECT 
+    SITE,
+    CHILD_COUNT as child_count
+FROM SITE_DIM
+ORDER BY SITE
+"""
+
+@ttl_cache(seconds=300)
 def get_available_sites() -> pd.DataFrame:
     """
     Get all available sites for location dropdown.
@@ -344,30 +382,86 @@ def get_available_sites() -> pd.DataFrame:
     db = get_database()
     
     try:
-        query = """
-        SELECT DISTINCT 
-            SITE,
-            COUNT(DISTINCT BENEFICIARY_ID) as child_count
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-        GROUP BY SITE
-        ORDER BY SITE
-        """
-        
-        df = db.execute_query(query)
+        df = db.execute_query(_Q_AVAILABLE_SITES)
         
         if df.empty:
             raise Exception("No sites found in database")
         else:
             # Process real data
-            df['site'] = df['SITE']
-            df['child_count'] = df['CHILD_COUNT'].astype(int)
-            
-            return df[['site', 'child_count']]
+            return _coerce(df, {
+                'site': ('SITE', 'category'),
+                'child_count': ('CHILD_COUNT', 'int64')
+            })
             
     except Exception as e:
         raise Exception(f"Failed to load available sites from database: {str(e)}")
 
+_Q_SITE_SUMMARY = """
+SELECT 
+    SITE,
+    CASE 
+        WHEN SITE_GROUP IS NULL
+            OR LOWER(TRIM(SITE_GROUP)) IN ('remove', 'delete', 'null', 'none', '', 'n/a', 'na')
+        THEN SITE
+        ELSE SITE_GROUP
+    END as clean_site_group,
+    COUNT(DISTINCT BENEFICIARY_ID) as total_children,
+    COUNT(DISTINCT HOUSEHOLD_ID) as total_households,
+    COUNT(*) as total_measurements,
+    ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
+    ROUND(SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as stunting_rate
+FROM SITE_NUTRITION_CLEAN
+WHERE SITE IN (%(sites)s)
+GROUP BY SITE, SITE_GROUP
+"""
+
+def get_site_summary_data_many(sites: List[str]) -> Dict[str, Dict[str, any]]:
+    """
+    Get site summary information for several sites in one query.
+    
+    Args:
+        sites: Site names to summarise
+    
+    Returns:
+        Dictionary mapping site name to its site summary data; sites without
+        data are omitted
+    """
+    
+    if not sites:
+        return {}
+    
+    db = get_database()
+    
+    try:
+        # The connector expands a tuple parameter into a quoted IN list
+        df = db.execute_query(_Q_SITE_SUMMARY, {"sites": tuple(sites)})
+        
+        if df.empty:
+            return {}
+        
+        # Fill nulls and cast in one vectorised step, one row per site.
+        # Placeholder site groups are already replaced by the site name in SQL.
+        df = (df.drop_duplicates(subset='SITE')
+                .fillna(_SUMMARY_DEFAULTS)
+                .astype(_SUMMARY_DTYPES))
+        
+        return {
+            row.SITE: {
+                'site_name': row.SITE,
+                'site_group': row.CLEAN_SITE_GROUP,
+                'total_children': int(row.TOTAL_CHILDREN),
+                'total_households': int(row.TOTAL_HOUSEHOLDS),
+                'total_measurements': int(row.TOTAL_MEASUREMENTS),
+                'avg_z_score': float(row.AVG_Z_SCORE),
+                'stunting_rate': float(row.STUNTING_RATE)
+            }
+            for row in df.itertuples(index=False)
+        }
+            
+    except Exception as e:
+        raise Exception(f"Failed to load site summary data for {len(sites)} sites: {str(e)}")
+
+@ttl_cache(seconds=300)
 def get_site_summary_data(site: str) -> Dict[str, any]:
     """
     Get site summary information for selected site.
@@ -379,55 +473,78 @@ def get_site_summary_data(site: str) -> Dict[str, any]:
         Dictionary with site summary data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        SELECT 
-            SITE,
-            SITE_GROUP,
-            COUNT(DISTINCT BENEFICIARY_ID) as total_children,
-            COUNT(DISTINCT HOUSEHOLD_ID) as total_households,
-            COUNT(*) as total_measurements,
-            ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
-            ROUND(SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as stunting_rate
-        FROM CHILD_NUTRITION_DATA 
-        WHERE SITE = %(site)s
-            AND FLAGGED = 0 AND DUPLICATE = 'False'
-        GROUP BY SITE, SITE_GROUP
-        """
-        
-        df = db.execute_query(query, {"site": site})
+        summaries = get_site_summary_data_many([site])
         
-        if df.empty:
+        if site not in summaries:
             raise Exception(f"No data found for site: {site}")
-        else:
-            # Safe data conversion with null handling
-            row = df.iloc[0]
-            
-            # Clean and validate site group data
-            site_group = str(row['SITE_GROUP']) if pd.notna(row['SITE_GROUP']) else ''
-            
-            # Filter out placeholder/invalid site groups
-            invalid_groups = ['remove', 'delete', 'null', 'none', '', 'n/a', 'na']
-            if site_group.lower().strip() in invalid_groups:
-                # Use site name as fallback for site group
-                site_name = str(row['SITE']) if pd.notna(row['SITE']) else 'Unknown Site'
-                site_group = site_name  # Use site name as site group when invalid
-            
-            return {
-                'site_name': str(row['SITE']) if pd.notna(row['SITE']) else 'Unknown Site',
-                'site_group': site_group,
-                'total_children': int(row['TOTAL_CHILDREN']) if pd.notna(row['TOTAL_CHILDREN']) else 0,
-                'total_households': int(row['TOTAL_HOUSEHOLDS']) if pd.notna(row['TOTAL_HOUSEHOLDS']) else 0,
-                'total_measurements': int(row['TOTAL_MEASUREMENTS']) if pd.notna(row['TOTAL_MEASUREMENTS']) else 0,
-                'avg_z_score': float(row['AVG_Z_SCORE']) if pd.notna(row['AVG_Z_SCORE']) else 0.0,
-                'stunting_rate': float(row['STUNTING_RATE']) if pd.notna(row['STUNTING_RATE']) else 0.0
-            }
+        
+        return summaries[site]
             
     except Exception as e:
         raise Exception(f"Failed to load site summary data for {site}: {str(e)}")
 
+# Per-site aggregates shared by the ranking cards and both comparison charts.
+# Metrics are left unrounded so ranks match the underlying values. Child counts
+# are exact because the "Children Measured" card reports and ranks them.
+_Q_PER_SITE_AGGREGATE = """
+SELECT 
+    SITE,
+    COUNT(DISTINCT BENEFICIARY_ID) as children_count,
+    AVG(WHO_INDEX) as avg_z_score,
+    SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as stunting_rate,
+    SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as severe_stunting_rate
+FROM SITE_NUTRITION_CLEAN
+GROUP BY SITE
+"""
+
+@ttl_cache(seconds=300)
+def _per_site_aggregate(db: DatabaseConnection) -> pd.DataFrame:
+    """
+    Get unrounded per-site aggregates for all sites.
+    
+    Args:
+        db: Database instance, resolved by the caller on the script thread
+    
+    Returns:
+        DataFrame with site, children_count, avg_z_score, stunting_rate and
+        severe_stunting_rate columns
+    """
+    
+    try:
+        df = db.execute_query(_Q_PER_SITE_AGGREGATE)
+        
+        # Site labels are stored as categoricals rather than Python strings
+        return _coerce(df, {
+            'site': ('SITE', 'category'),
+            'children_count': ('CHILDREN_COUNT', 'int64'),
+            'avg_z_score': ('AVG_Z_SCORE', 'float64'),
+            'stunting_rate': ('STUNTING_RATE', 'float64'),
+            'severe_stunting_rate': ('SEVERE_STUNTING_RATE', 'float64')
+        })
+            
+    except Exception as e:
+        raise Exception(f"Failed to load site aggregates from database: {str(e)}")
+
+def _rank_of(values: np.ndarray, value: float, descending: bool) -> int:
+    """
+    Rank a value among all site values with RANK() semantics (ties share a rank).
+    
+    Only the selected site's position is needed, so this counts the sites that
+    strictly beat it instead of materialising a full sort order.
+    
+    Args:
+        values: Metric values for every site
+        value: Metric value of the selected site
+        descending: True if higher values rank first
+    
+    Returns:
+        1-based rank
+    """
+    better = values > value if descending else values < value
+    return int(np.count_nonzero(better) + 1)
+
+@ttl_cache(seconds=300)
 def get_site_rankings(site: str) -> Dict[str, Dict[str, any]]:
     """
     Get site rankings for performance cards.
@@ -439,157 +556,145 @@ def get_site_rankings(site: str) -> Dict[str, Dict[str, any]]:
         Dictionary with ranking data for each metric
     """
     
-    db = get_database()
-    
     try:
-        # Children measured ranking
-        children_query = """
-        WITH site_rankings AS (
-            SELECT 
-                SITE,
-                COUNT(DISTINCT BENEFICIARY_ID) as children_count,
-                RANK() OVER (ORDER BY COUNT(DISTINCT BENEFICIARY_ID) DESC) as rank,
-                COUNT(*) OVER () as total_sites
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-            GROUP BY SITE
-        )
-        SELECT children_count, rank, total_sites
-        FROM site_rankings 
-        WHERE SITE = %(site)s
-        """
-        
-        children_df = db.execute_query(children_query, {"site": site})
-        
-        # Average z-score ranking
-        zscore_query = """
-        WITH site_rankings AS (
-            SELECT 
-                SITE,
-                AVG(WHO_INDEX) as avg_z_score,
-                RANK() OVER (ORDER BY AVG(WHO_INDEX) DESC) as rank,
-                COUNT(*) OVER () as total_sites
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-            GROUP BY SITE
-        )
-        SELECT ROUND(avg_z_score, 2) as avg_z_score, rank, total_sites
-        FROM site_rankings 
-        WHERE SITE = %(site)s
-        """
+        df = _per_site_aggregate(get_database())
+        selected = df[df['site'] == site]
         
-        zscore_df = db.execute_query(zscore_query, {"site": site})
-        
-        # Stunting rate ranking
-        stunting_query = """
-        WITH site_rankings AS (
-            SELECT 
-                SITE,
-                SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as stunting_rate,
-                RANK() OVER (ORDER BY SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) ASC) as rank,
-                COUNT(*) OVER () as total_sites
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-            GROUP BY SITE
-        )
-        SELECT ROUND(stunting_rate, 1) as stunting_rate, rank, total_sites
-        FROM site_rankings 
-        WHERE SITE = %(site)s
-        """
+        if selected.empty:
+            empty = {'value': 0, 'rank': 0, 'total': 0}
+            return {
+                'children_measured': dict(empty),
+                'avg_z_score': dict(empty, value=0.0),
+                'stunting_rate': dict(empty, value=0.0),
+                'severe_stunting_rate': dict(empty, value=0.0)
+            }
         
-        stunting_df = db.execute_query(stunting_query, {"site": site})
+        row = selected.iloc[0]
+        total = len(df)
         
-        # Severe stunting ranking
-        severe_stunting_query = """
-        WITH site_rankings AS (
-            SELECT 
-                SITE,
-                SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as severe_stunting_rate,
-                RANK() OVER (ORDER BY SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) ASC) as rank,
-                COUNT(*) OVER () as total_sites
-            FROM CHILD_NUTRITION_DATA 
-            WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-            GROUP BY SITE
-        )
-        SELECT ROUND(severe_stunting_rate, 1) as severe_stunting_rate, rank, total_sites
-        FROM site_rankings 
-        WHERE SITE = %(site)s
-        """
-        
-        severe_stunting_df = db.execute_query(severe_stunting_query, {"site": site})
+        def metric(column: str, descending: bool, decimals: Optional[int] = None) -> Dict[str, any]:
+            value = row[column]
+            return {
+                'value': int(value) if decimals is None else round(float(value), decimals),
+                'rank': _rank_of(df[column].to_numpy(), value, descending),
+                'total': total
+            }
         
         return {
-            'children_measured': {
-                'value': int(children_df.iloc[0]['CHILDREN_COUNT']) if not children_df.empty else 0,
-                'rank': int(children_df.iloc[0]['RANK']) if not children_df.empty else 0,
-                'total': int(children_df.iloc[0]['TOTAL_SITES']) if not children_df.empty else 0
-            },
-            'avg_z_score': {
-                'value': float(zscore_df.iloc[0]['AVG_Z_SCORE']) if not zscore_df.empty else 0.0,
-                'rank': int(zscore_df.iloc[0]['RANK']) if not zscore_df.empty else 0,
-                'total': int(zscore_df.iloc[0]['TOTAL_SITES']) if not zscore_df.empty else 0
-            },
-            'stunting_rate': {
-                'value': float(stunting_df.iloc[0]['STUNTING_RATE']) if not stunting_df.empty else 0.0,
-                'rank': int(stunting_df.iloc[0]['RANK']) if not stunting_df.empty else 0,
-                'total': int(stunting_df.iloc[0]['TOTAL_SITES']) if not stunting_df.empty else 0
-            },
-            'severe_stunting_rate': {
-                'value': float(severe_stunting_df.iloc[0]['SEVERE_STUNTING_RATE']) if not severe_stunting_df.empty else 0.0,
-                'rank': int(severe_stunting_df.iloc[0]['RANK']) if not severe_stunting_df.empty else 0,
-                'total': int(severe_stunting_df.iloc[0]['TOTAL_SITES']) if not severe_stunting_df.empty else 0
-            }
+            'children_measured': metric('children_count', descending=True),
+            'avg_z_score': metric('avg_z_score', descending=True, decimals=2),
+            'stunting_rate': metric('stunting_rate', descending=False, decimals=1),
+            'severe_stunting_rate': metric('severe_stunting_rate', descending=False, decimals=1)
         }
         
     except Exception as e:
         raise Exception(f"Failed to load site rankings for {site}: {str(e)}")
 
-def get_site_temporal_data(site: str) -> pd.DataFrame:
+# Quarterly site metrics are precomputed nightly (sql/004), so this is a
+# lookup of at most ~20 rows per site.
+_Q_SITE_TEMPORAL = """
+SELECT 
+    QUARTER as quarter,
+    MEASUREMENT_COUNT as measurement_count,
+    ROUND(AVG_Z_SCORE, 2) as avg_z_score,
+    ROUND(STUNTING_RATE, 1) as stunting_rate,
+    ROUND(SEVERE_STUNTING_RATE, 1) as severe_stunting_rate
+FROM SITE_QUARTER_NUTRITION
+WHERE SITE = %(site)s
+    AND QUARTER >= DATE_TRUNC('quarter', DATEADD(year, -5, CURRENT_DATE()))
+ORDER BY QUARTER
+"""
+
+@ttl_cache(seconds=300)
+def _site_temporal(db: DatabaseConnection, site: str) -> pd.DataFrame:
     """
-    Get temporal trends data for selected site (Chart 1).
+    Get quarterly trends for a site.
     
     Args:
+        db: Database instance, resolved by the caller on the script thread
         site: Selected site name
     
     Returns:
         DataFrame with temporal data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        SELECT 
-            DATE_TRUNC('quarter', CAPTURE_DATE) as quarter,
-            COUNT(*) as measurement_count,
-            ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
-            ROUND(SUM(CASE WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as stunting_rate,
-            ROUND(SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as severe_stunting_rate
-        FROM CHILD_NUTRITION_DATA 
-        WHERE SITE = %(site)s
-            AND FLAGGED = 0 AND DUPLICATE = 'False'
-            AND CAPTURE_DATE >= DATEADD(year, -5, CURRENT_DATE())
-        GROUP BY DATE_TRUNC('quarter', CAPTURE_DATE)
-        ORDER BY quarter
-        """
-        
-        df = db.execute_query(query, {"site": site})
+        df = db.execute_query(_Q_SITE_TEMPORAL, {"site": site})
         
         if df.empty:
             raise Exception(f"No temporal data found for site: {site}")
         else:
             # Process real data
-            df['period'] = df['QUARTER'].astype(str)
-            df['measurement_count'] = df['MEASUREMENT_COUNT'].astype(int)
-            df['avg_z_score'] = df['AVG_Z_SCORE'].astype(float)
-            df['stunting_rate'] = df['STUNTING_RATE'].astype(float)
-            df['severe_stunting_rate'] = df['SEVERE_STUNTING_RATE'].astype(float)
-            
-            return df[['period', 'measurement_count', 'avg_z_score', 'stunting_rate', 'severe_stunting_rate']]
+            return _coerce(df, {
+                'period': ('QUARTER', 'str'),
+                'measurement_count': ('MEASUREMENT_COUNT', 'int64'),
+                'avg_z_score': ('AVG_Z_SCORE', 'float64'),
+                'stunting_rate': ('STUNTING_RATE', 'float64'),
+                'severe_stunting_rate': ('SEVERE_STUNTING_RATE', 'float64')
+            })
             
     except Exception as e:
         raise Exception(f"Failed to load temporal data for {site}: {str(e)}")
 
+def get_site_temporal_data(site: str) -> pd.DataFrame:
+    """
+    Get temporal trends data for selected site (Chart 1).
+    
+    Args:
+        site: Selected site name
+    
+    Returns:
+        DataFrame with temporal data
+    """
+    return _site_temporal(get_database(), site)
+
+# First and latest WHO z-score per child for a site, shared by the category
+# and status distribution charts so the per-child window sort runs once.
+_Q_LATEST_PER_BENEFICIARY = """
+WITH measurements AS (
+    SELECT BENEFICIARY_ID, WHO_INDEX,
+           ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as rn_asc,
+           ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn_desc
+    FROM SITE_NUTRITION_CLEAN
+    WHERE SITE = %(site)s
+)
+SELECT 
+    BENEFICIARY_ID,
+    MAX(CASE WHEN rn_asc = 1 THEN WHO_INDEX END) as first_who_index,
+    MAX(CASE WHEN rn_desc = 1 THEN WHO_INDEX END) as who_index
+FROM measurements
+WHERE rn_asc = 1 OR rn_desc = 1
+GROUP BY BENEFICIARY_ID
+"""
+
+@ttl_cache(seconds=60)
+def _latest_per_beneficiary(db: DatabaseConnection, site: str) -> pd.DataFrame:
+    """
+    Get each child's first and most recent WHO z-score for a site.
+    
+    Args:
+        db: Database instance, resolved by the caller on the script thread
+        site: Selected site name
+    
+    Returns:
+        DataFrame with BENEFICIARY_ID, FIRST_WHO_INDEX and WHO_INDEX (latest)
+    """
+    
+    try:
+        return db.execute_query(_Q_LATEST_PER_BENEFICIARY, {"site": site})
+            
+    except Exception as e:
+        raise Exception(f"Failed to load latest measurements for {site}: {str(e)}")
+
+def _category_counts(z_scores: pd.Series) -> Dict[str, int]:
+    """Count children per risk category (bounds are inclusive, as SQL BETWEEN)."""
+    return {
+        'at_risk': int(z_scores.between(-2, -1).sum()),
+        'stunted': int(z_scores.between(-3, -2).sum()),
+        'severely_stunted': int((z_scores < -3).sum())
+    }
+
+@ttl_cache(seconds=300)
 def get_site_category_data(site: str) -> pd.DataFrame:
     """
     Get category comparison data for selected site (Chart 2).
@@ -601,65 +706,50 @@ def get_site_category_data(site: str) -> pd.DataFrame:
         DataFrame with category data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        WITH first_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = %(site)s AND FLAGGED = 0 AND DUPLICATE = 'False'
-        ),
-        last_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = %(site)s AND FLAGGED = 0 AND DUPLICATE = 'False'
-        ),
-        site_totals AS (
-            SELECT COUNT(DISTINCT BENEFICIARY_ID) as total
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = %(site)s AND FLAGGED = 0 AND DUPLICATE = 'False'
-        )
-        SELECT 
-            'First Measurement' as period,
-            SUM(CASE WHEN WHO_INDEX BETWEEN -2 AND -1 THEN 1 ELSE 0 END) as at_risk,
-            SUM(CASE WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 1 ELSE 0 END) as stunted,
-            SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) as severely_stunted
-        FROM first_measurements WHERE rn = 1
-        UNION ALL
-        SELECT 
-            'Last Measurement' as period,
-            SUM(CASE WHEN WHO_INDEX BETWEEN -2 AND -1 THEN 1 ELSE 0 END) as at_risk,
-            SUM(CASE WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 1 ELSE 0 END) as stunted,
-            SUM(CASE WHEN WHO_INDEX < -3 THEN 1 ELSE 0 END) as severely_stunted
-        FROM last_measurements WHERE rn = 1
-        UNION ALL
-        SELECT 
-            'Target' as period,
-            CAST(total * 0.025 AS INTEGER) as at_risk,
-            CAST(total * 0.025 AS INTEGER) as stunted,
-            CAST(total * 0.0015 AS INTEGER) as severely_stunted
-        FROM site_totals
-        """
+        latest = _latest_per_beneficiary(get_database(), site)
         
-        df = db.execute_query(query, {"site": site})
-        
-        if df.empty:
+        if latest.empty:
             raise Exception(f"No category data found for site: {site}")
-        else:
-            # Process real data
-            df['category'] = df['PERIOD']  # Rename 'period' to 'category' for chart compatibility
-            df['at_risk'] = df['AT_RISK'].astype(int)
-            df['stunted'] = df['STUNTED'].astype(int)
-            df['severely_stunted'] = df['SEVERELY_STUNTED'].astype(int)
-            
-            return df[['category', 'at_risk', 'stunted', 'severely_stunted']]
+        
+        # Targets are 2.5% / 2.5% / 0.15% of children, rounded half up
+        total = len(latest)
+        target_2_5 = (total * 25 + 500) // 1000
+        target_0_15 = (total * 15 + 5000) // 10000
+        
+        rows = [
+            dict(category='First Measurement', **_category_counts(latest['FIRST_WHO_INDEX'])),
+            dict(category='Last Measurement', **_category_counts(latest['WHO_INDEX'])),
+            dict(category='Target', at_risk=target_2_5, stunted=target_2_5, severely_stunted=target_0_15)
+        ]
+        
+        return pd.DataFrame(rows, columns=['category', 'at_risk', 'stunted', 'severely_stunted'])
             
     except Exception as e:
         raise Exception(f"Failed to load category data for {site}: {str(e)}")
 
+# Status buckets by WHO z-score, lower bound inclusive:
+# [-inf, -3) Severely Stunted, [-3, -2) Stunted, [-2, -1) At Risk, [-1, inf) Normal
+_STATUS_EDGES = np.array([-3, -2, -1])
+_STATUS_LABELS = ['Severely Stunted', 'Stunted', 'At Risk', 'Normal']
+_STATUS_ORDER = ['Normal', 'At Risk', 'Stunted', 'Severely Stunted']
+
+def _classify_z_scores(z_scores: pd.Series) -> pd.Categorical:
+    """
+    Map WHO z-scores to status labels; missing scores stay missing.
+    
+    Args:
+        z_scores: WHO_INDEX values
+    
+    Returns:
+        Categorical of status labels aligned with z_scores
+    """
+    values = z_scores.to_numpy(dtype='float64')
+    codes = np.searchsorted(_STATUS_EDGES, values, side='right')
+    codes[np.isnan(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=_STATUS_LABELS)
+
+@ttl_cache(seconds=300)
 def get_site_status_distribution(site: str) -> pd.DataFrame:
     """
     Get current status distribution for selected site (Chart 3).
@@ -671,52 +761,27 @@ def get_site_status_distribution(site: str) -> pd.DataFrame:
         DataFrame with status distribution data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        WITH latest_measurements AS (
-            SELECT BENEFICIARY_ID, WHO_INDEX,
-                   ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = %(site)s AND FLAGGED = 0 AND DUPLICATE = 'False'
-        )
-        SELECT 
-            CASE 
-                WHEN WHO_INDEX >= -1 THEN 'Normal'
-                WHEN WHO_INDEX BETWEEN -2 AND -1 THEN 'At Risk'
-                WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 'Stunted'
-                WHEN WHO_INDEX < -3 THEN 'Severely Stunted'
-            END as status,
-            COUNT(*) as count,
-            ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 1) as percentage
-        FROM latest_measurements
-        WHERE rn = 1
-        GROUP BY status
-        ORDER BY 
-            CASE status
-                WHEN 'Normal' THEN 1
-                WHEN 'At Risk' THEN 2
-                WHEN 'Stunted' THEN 3
-                WHEN 'Severely Stunted' THEN 4
-            END
-        """
+        latest = _latest_per_beneficiary(get_database(), site)['WHO_INDEX']
+        statuses = pd.Series(_classify_z_scores(latest))
         
-        df = db.execute_query(query, {"site": site})
+        # Only statuses that occur are reported, in display order
+        counts = statuses.value_counts().reindex(_STATUS_ORDER)
+        counts = counts[counts > 0]
         
-        if df.empty:
+        if counts.empty:
             raise Exception(f"No status distribution data found for site: {site}")
-        else:
-            # Process real data
-            df['status'] = df['STATUS']
-            df['count'] = df['COUNT'].astype(int)
-            df['percentage'] = df['PERCENTAGE'].astype(float)
-            
-            return df[['status', 'count', 'percentage']]
+        
+        return pd.DataFrame({
+            'status': counts.index.astype(str),
+            'count': counts.to_numpy(dtype='int64'),
+            'percentage': (counts * 100.0 / counts.sum()).round(1).to_numpy()
+        })
             
     except Exception as e:
         raise Exception(f"Failed to load status distribution data for {site}: {str(e)}")
 
+@ttl_cache(seconds=300)
 def get_z_score_comparison_data(selected_site: str) -> pd.DataFrame:
     """
     Get z-score comparison data across all sites (Chart 4).
@@ -728,37 +793,22 @@ def get_z_score_comparison_data(selected_site: str) -> pd.DataFrame:
         DataFrame with z-score comparison data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        SELECT 
-            SITE,
-            COUNT(DISTINCT BENEFICIARY_ID) as children_count,
-            ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
-            CASE WHEN SITE = %(selected_site)s THEN 1 ELSE 0 END as is_current
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-        GROUP BY SITE
-        ORDER BY children_count DESC
-        """
-        
-        df = db.execute_query(query, {"selected_site": selected_site})
+        df = _per_site_aggregate(get_database())
         
         if df.empty:
             raise Exception("No z-score comparison data found")
-        else:
-            # Process real data
-            df['site'] = df['SITE']
-            df['children_count'] = df['CHILDREN_COUNT'].astype(int)
-            df['avg_z_score'] = df['AVG_Z_SCORE'].astype(float)
-            df['is_current'] = df['IS_CURRENT'].astype(bool)
-            
-            return df[['site', 'children_count', 'avg_z_score', 'is_current']]
+        
+        return (df.assign(avg_z_score=df['avg_z_score'].round(2),
+                          is_current=df['site'] == selected_site)
+                  .sort_values('children_count', ascending=False, kind='stable')
+                  [['site', 'children_count', 'avg_z_score', 'is_current']]
+                  .reset_index(drop=True))
             
     except Exception as e:
         raise Exception(f"Failed to load z-score comparison data: {str(e)}")
 
+@ttl_cache(seconds=300)
 def get_stunting_comparison_data(selected_site: str) -> pd.DataFrame:
     """
     Get stunting rate comparison data across all sites (Chart 5).
@@ -770,33 +820,17 @@ def get_stunting_comparison_data(selected_site: str) -> pd.DataFrame:
         DataFrame with stunting comparison data
     """
     
-    db = get_database()
-    
     try:
-        query = """
-        SELECT 
-            SITE,
-            COUNT(DISTINCT BENEFICIARY_ID) as children_count,
-            ROUND(SUM(CASE WHEN WHO_INDEX < -2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as stunting_rate,
-            CASE WHEN SITE = %(selected_site)s THEN 1 ELSE 0 END as is_current
-        FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
-        GROUP BY SITE
-        ORDER BY stunting_rate ASC
-        """
-        
-        df = db.execute_query(query, {"selected_site": selected_site})
+        df = _per_site_aggregate(get_database())
         
         if df.empty:
             raise Exception("No stunting comparison data found")
-        else:
-            # Process real data
-            df['site'] = df['SITE']
-            df['children_count'] = df['CHILDREN_COUNT'].astype(int)
-            df['stunting_rate'] = df['STUNTING_RATE'].astype(float)
-            df['is_current'] = df['IS_CURRENT'].astype(bool)
-            
-            return df[['site', 'children_count', 'stunting_rate', 'is_current']]
+        
+        return (df.assign(stunting_rate=df['stunting_rate'].round(1),
+                          is_current=df['site'] == selected_site)
+                  .sort_values('stunting_rate', ascending=True, kind='stable')
+                  [['site', 'children_count', 'stunting_rate', 'is_current']]
+                  .reset_index(drop=True))
             
     except Exception as e:
         raise Exception(f"Failed to load stunting comparison data: {str(e)}")
@@ -812,39 +846,118 @@ def get_measurement_volume_data(site: str) -> pd.DataFrame:
         DataFrame with measurement volume data
     """
     
-    db = get_database()
+    try:
+        # Measurement counts are already part of the (cached) temporal query
+        return get_site_temporal_data(site)[['period', 'measurement_count']]
+            
+    except Exception as e:
+        raise Exception(f"Failed to load measurement volume data for {site}: {str(e)}")
+
+def load_site_bundle(site: str) -> Dict[str, any]:
+    """
+    Load all location page data for a site, running the warehouse queries concurrently.
+    
+    The page's charts are derived from three underlying queries (the per-site
+    aggregate, the per-child first/latest z-scores and the quarterly trends).
+    Those are fetched in parallel threads; the public functions then slice the
+    warm caches. The workers have no Streamlit script context, so the database
+    instance is resolved here and passed in rather than looked up per thread.
+    
+    Args:
+        site: Selected site name
+    
+    Returns:
+        Dictionary with rankings, temporal, category, status, zscore_comparison,
+        stunting_comparison and volume entries
+    """
     
     try:
-        query = """
-        SELECT 
-            DATE_TRUNC('quarter', CAPTURE_DATE) as quarter,
-            COUNT(*) as measurement_count
-        FROM CHILD_NUTRITION_DATA 
-        WHERE SITE = %(site)s
-            AND FLAGGED = 0 AND DUPLICATE = 'False'
-            AND CAPTURE_DATE >= DATEADD(year, -5, CURRENT_DATE())
-        GROUP BY DATE_TRUNC('quarter', CAPTURE_DATE)
-        ORDER BY quarter
-        """
+        db = get_database()
         
-        df = db.execute_query(query, {"site": site})
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_per_site_aggregate, db),
+                executor.submit(_latest_per_beneficiary, db, site),
+                executor.submit(_site_temporal, db, site)
+            ]
+            for future in futures:
+                future.result()
         
-        if df.empty:
-            raise Exception(f"No measurement volume data found for site: {site}")
-        else:
-            # Process real data
-            df['period'] = df['QUARTER'].astype(str)
-            df['measurement_count'] = df['MEASUREMENT_COUNT'].astype(int)
-            
-            return df[['period', 'measurement_count']]
+        return {
+            'rankings': get_site_rankings(site),
+            'temporal': get_site_temporal_data(site),
+            'category': get_site_category_data(site),
+            'status': get_site_status_distribution(site),
+            'zscore_comparison': get_z_score_comparison_data(site),
+            'stunting_comparison': get_stunting_comparison_data(site),
+            'volume': get_measurement_volume_data(site)
+        }
             
     except Exception as e:
-        raise Exception(f"Failed to load measurement volume data for {site}: {str(e)}")
+        raise Exception(f"Failed to load location data for {site}: {str(e)}")
 
 # ============================================================================
 # CHILD ANALYSIS PAGE QUERIES
 # ============================================================================
 
+def _child_name(first_names: pd.Series, last_names: pd.Series) -> pd.Series:
+    """Join first and last names, treating missing parts as empty."""
+    return (first_names.fillna('') + ' ' + last_names.fillna('')).str.strip()
+
+# One scan: window aggregates per child, keeping each child's latest row
+_Q_CHILDREN_FOR_SITE_TEMPLATE = """
+SELECT 
+    BENEFICIARY_ID,
+    FIRST_NAMES,
+    LAST_NAME,
+    HOUSEHOLD,
+    SITE,
+    COUNT(*) OVER (PARTITION BY BENEFICIARY_ID) as measurement_count,
+    MIN(CAPTURE_DATE) OVER (PARTITION BY BENEFICIARY_ID) as first_measurement_date,
+    MAX(CAPTURE_DATE) OVER (PARTITION BY BENEFICIARY_ID) as last_measurement_date,
+    ROUND(AVG(WHO_INDEX) OVER (PARTITION BY BENEFICIARY_ID), 2) as avg_z_score,
+    WHO_INDEX as latest_z_score
+FROM CND_CLEAN 
+WHERE SITE = %(site)s{search_condition}
+QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) = 1
+ORDER BY FIRST_NAMES, LAST_NAME
+LIMIT 50
+"""
+
+_Q_CHILDREN_FOR_SITE = _Q_CHILDREN_FOR_SITE_TEMPLATE.format(search_condition="")
+_Q_CHILDREN_FOR_SITE_SEARCH = _Q_CHILDREN_FOR_SITE_TEMPLATE.format(search_condition="""
+    AND (
+        LOWER(FIRST_NAMES) LIKE LOWER(%(search)s)
+        OR LOWER(LAST_NAME) LIKE LOWER(%(search)s)
+        OR CAST(BENEFICIARY_ID AS VARCHAR) LIKE %(search)s
+    )""")
+
+@ttl_cache(seconds=300)
+def _children_for_site(site: str, search_term: str) -> pd.DataFrame:
+    """
+    Get the children measured at a site, optionally filtered by a search term.
+    
+    Errors propagate so that a failed query is never cached.
+    
+    Args:
+        site: Selected site name
+        search_term: Search term for filtering by name or ID; blank for none
+    
+    Returns:
+        DataFrame with one row per child
+    """
+    db = get_database()
+    
+    # The search term is bound as a parameter with the LIKE wildcards
+    # inside the value, never interpolated into the SQL
+    params = {"site": site}
+    query = _Q_CHILDREN_FOR_SITE
+    if search_term.strip():
+        params["search"] = f"%{search_term}%"
+        query = _Q_CHILDREN_FOR_SITE_SEARCH
+    
+    return db.execute_query(query, params)
+
 def get_available_children_for_site(site: str, search_term: str = "") -> List[Dict]:
     """
     Get available children for a selected site with optional search filtering.
@@ -856,193 +969,191 @@ def get_available_children_for_site(site: str, search_term: str = "") -> List[Di
     Returns:
         List of dictionaries with child information
     """
-    db = get_database()
-    
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        # Build search condition
-        search_condition = ""
-        if search_term.strip():
-            search_condition = f"""
-                AND (
-                    LOWER(FIRST_NAMES) LIKE LOWER('%{search_term}%')
-                    OR LOWER(LAST_NAME) LIKE LOWER('%{search_term}%')
-                    OR CAST(BENEFICIARY_ID AS VARCHAR) LIKE '%{search_term}%'
-                )
-            """
-        
-        query = f"""
-        WITH child_summary AS (
-            SELECT 
-                BENEFICIARY_ID,
-                FIRST_NAMES,
-                LAST_NAME,
-                HOUSEHOLD,
-                SITE,
-                COUNT(*) as measurement_count,
-                MIN(CAPTURE_DATE) as first_measurement_date,
-                MAX(CAPTURE_DATE) as last_measurement_date,
-                ROUND(AVG(WHO_INDEX), 2) as avg_z_score
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = '{site}'
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-                {search_condition}
-            GROUP BY BENEFICIARY_ID, FIRST_NAMES, LAST_NAME, HOUSEHOLD, SITE
-        ),
-        latest_measurements AS (
-            SELECT 
-                BENEFICIARY_ID,
-                WHO_INDEX as latest_z_score,
-                ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE SITE = '{site}'
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-                {search_condition}
-        )
-        SELECT 
-            cs.BENEFICIARY_ID,
-            cs.FIRST_NAMES,
-            cs.LAST_NAME,
-            cs.HOUSEHOLD,
-            cs.SITE,
-            cs.measurement_count,
-            cs.first_measurement_date,
-            cs.last_measurement_date,
-            cs.avg_z_score,
-            lm.latest_z_score
-        FROM child_summary cs
-        LEFT JOIN latest_measurements lm ON cs.BENEFICIARY_ID = lm.BENEFICIARY_ID AND lm.rn = 1
-        ORDER BY cs.FIRST_NAMES, cs.LAST_NAME
-        LIMIT 50
-        """
-        
-        df = db.execute_query(query)
+        df = _children_for_site(site, search_term)
         
-        children = []
-        for _, row in df.iterrows():
-            # Format child name
-            first_name = row['FIRST_NAMES'] if pd.notna(row['FIRST_NAMES']) else ""
-            last_name = row['LAST_NAME'] if pd.notna(row['LAST_NAME']) else ""
-            full_name = f"{first_name} {last_name}".strip()
-            
-            children.append({
-                'beneficiary_id': row['BENEFICIARY_ID'],
-                'name': full_name,
-                'first_name': first_name,
-                'last_name': last_name,
-                'household': row['HOUSEHOLD'],
-                'site': row['SITE'],
-                'measurement_count': row['MEASUREMENT_COUNT'],
-                'first_measurement_date': row['FIRST_MEASUREMENT_DATE'],
-                'last_measurement_date': row['LAST_MEASUREMENT_DATE'],
-                'avg_z_score': row['AVG_Z_SCORE'],
-                'latest_z_score': row['LATEST_Z_SCORE']
-            })
-        
-        return children
+        if df.empty:
+            return []
+        
+        df['FIRST_NAMES'] = df['FIRST_NAMES'].fillna('')
+        df['LAST_NAME'] = df['LAST_NAME'].fillna('')
+        df['name'] = _child_name(df['FIRST_NAMES'], df['LAST_NAME'])
+        
+        return (df.rename(columns={
+                    'BENEFICIARY_ID': 'beneficiary_id',
+                    'FIRST_NAMES': 'first_name',
+                    'LAST_NAME': 'last_name',
+                    'HOUSEHOLD': 'household',
+                    'SITE': 'site',
+                    'MEASUREMENT_COUNT': 'measurement_count',
+                    'FIRST_MEASUREMENT_DATE': 'first_measurement_date',
+                    'LAST_MEASUREMENT_DATE': 'last_measurement_date',
+                    'AVG_Z_SCORE': 'avg_z_score',
+                    'LATEST_Z_SCORE': 'latest_z_score'
+                })
+                [['beneficiary_id', 'name', 'first_name', 'last_name', 'household', 'site',
+                  'measurement_count', 'first_measurement_date', 'last_measurement_date',
+                  'avg_z_score', 'latest_z_score']]
+                .to_dict(orient='records'))
         
     except Exception as e:
         print(f"Error in get_available_children_for_site: {e}")
         return []
 
-def get_child_profile_data(beneficiary_id: int) -> Dict:
+def _signed(values: pd.Series, decimals: int) -> pd.Series:
+    """Format numeric changes with an explicit '+' for non-negative values; missing stays missing."""
+    # Adding 0.0 turns -0.0 into 0.0 so tiny decreases do not print as "+-0.0"
+    rounded = values.round(decimals) + 0.0
+    text = pd.Series(np.where(rounded >= 0, '+', ''), index=values.index, dtype=object) + rounded.astype(str)
+    return text.where(values.notna())
+
+# Most recent measurements fetched per child. Whole-history figures are
+# computed by window functions before QUALIFY trims older rows, so profiles
+# and progress metrics stay exact for children with longer histories.
+_MAX_MEASUREMENTS_PER_CHILD = 500
+
+_Q_CHILD_MEASUREMENTS = """
+SELECT 
+    BENEFICIARY_ID,
+    FIRST_NAMES,
+    LAST_NAME,
+    HOUSEHOLD,
+    SITE,
+    CAPTURE_DATE,
+    ANSWER,
+    WHO_INDEX,
+    COUNT(*) OVER (PARTITION BY BENEFICIARY_ID) as total_measurements,
+    MIN(CAPTURE_DATE) OVER (PARTITION BY BENEFICIARY_ID) as first_capture_date,
+    FIRST_VALUE(ANSWER) OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as first_answer,
+    FIRST_VALUE(WHO_INDEX) OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE) as first_who_index,
+    AVG(WHO_INDEX) OVER (PARTITION BY BENEFICIARY_ID) as avg_z_score,
+    MAX(ANSWER) OVER (PARTITION BY BENEFICIARY_ID)
+        - MIN(ANSWER) OVER (PARTITION BY BENEFICIARY_ID) as height_gain_cm
+FROM CND_CLEAN 
+WHERE BENEFICIARY_ID IN (%(ids)s)
+QUALIFY ROW_NUMBER() OVER (PARTITION BY BENEFICIARY_ID ORDER BY CAPTURE_DATE DESC) <= %(limit)s
+ORDER BY BENEFICIARY_ID, CAPTURE_DATE
+"""
+
+@ttl_cache(seconds=300)
+def _children_measurements(beneficiary_ids: Tuple[int, ...]) -> pd.DataFrame:
     """
-    Get comprehensive profile data for a specific child.
+    Get the most recent valid measurements for one or more children in a
+    single query.
     
     Args:
-        beneficiary_id: Child's beneficiary ID
+        beneficiary_ids: Children's beneficiary IDs
     
     Returns:
-        Dictionary with child profile information
+        DataFrame with up to _MAX_MEASUREMENTS_PER_CHILD rows per child,
+        ordered by child and CAPTURE_DATE, with whole-history aggregates on
+        every row plus DATE, AGE_YEARS and STATUS columns
     """
     db = get_database()
     
+    # The connector expands a tuple parameter into an IN list
+    df = db.execute_query(_Q_CHILD_MEASUREMENTS, {"ids": tuple(beneficiary_ids),
+                                                  "limit": _MAX_MEASUREMENTS_PER_CHILD})
+    
+    if df.empty:
+        return df
+    
+    dates = pd.to_datetime(df['CAPTURE_DATE'])
+    first_dates = pd.to_datetime(df['FIRST_CAPTURE_DATE'])
+    df['DATE'] = dates.dt.strftime('%Y-%m-%d')
+    df['AGE_YEARS'] = ((dates - first_dates).dt.days / 365.25).round(1)
+    df['STATUS'] = _classify_z_scores(df['WHO_INDEX'])
+    
+    return df
+
+def _child_bundle(beneficiary_id: int) -> pd.DataFrame:
+    """
+    Get the most recent valid measurements for a child.
+    
+    All child page functions slice this frame, so a child's page costs one
+    warehouse round-trip instead of five.
+    
+    Args:
+        beneficiary_id: Child's beneficiary ID
+    
+    Returns:
+        DataFrame with one row per measurement, ordered by CAPTURE_DATE
+    """
+    return _children_measurements((beneficiary_id,))
+
+def _profiles_from_measurements(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarise measurement rows into one profile row per child.
+    
+    Names, household and site come from each child's latest measurement;
+    totals and averages come from the whole-history window columns.
+    
+    Args:
+        df: Rows from _children_measurements, ordered by child and date
+    
+    Returns:
+        DataFrame with one profile per child, in the order children appear
+    """
+    latest = df.drop_duplicates('BENEFICIARY_ID', keep='last')
+    
+    return pd.DataFrame({
+        'beneficiary_id': latest['BENEFICIARY_ID'],
+        'name': _child_name(latest['FIRST_NAMES'], latest['LAST_NAME']),
+        'first_name': latest['FIRST_NAMES'].fillna(''),
+        'last_name': latest['LAST_NAME'].fillna(''),
+        'household': latest['HOUSEHOLD'],
+        'site': latest['SITE'],
+        'total_measurements': latest['TOTAL_MEASUREMENTS'],
+        'first_measurement_date': latest['FIRST_CAPTURE_DATE'],
+        'last_measurement_date': latest['CAPTURE_DATE'],
+        'age_years': latest['AGE_YEARS'],
+        'avg_z_score': latest['AVG_Z_SCORE'].round(2),
+        'latest_z_score': latest['WHO_INDEX'],
+        'latest_height': latest['ANSWER'],
+        'height_gain_cm': latest['HEIGHT_GAIN_CM']
+    })
+
+def get_children_profile_data(beneficiary_ids: List[int]) -> Dict[int, Dict]:
+    """
+    Get profile data for several children in one query.
+    
+    Args:
+        beneficiary_ids: Children's beneficiary IDs
+    
+    Returns:
+        Dictionary mapping beneficiary ID to its profile data; children
+        without valid measurements are omitted
+    """
+    if not beneficiary_ids:
+        return {}
+    
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        query = f"""
-        WITH child_summary AS (
-            SELECT 
-                BENEFICIARY_ID,
-                FIRST_NAMES,
-                LAST_NAME,
-                HOUSEHOLD,
-                SITE,
-                COUNT(*) as total_measurements,
-                MIN(CAPTURE_DATE) as first_measurement_date,
-                MAX(CAPTURE_DATE) as last_measurement_date,
-                ROUND(DATEDIFF(day, MIN(CAPTURE_DATE), MAX(CAPTURE_DATE)) / 365.25, 1) as age_years,
-                ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
-                MAX(ANSWER) - MIN(ANSWER) as height_gain_cm
-            FROM CHILD_NUTRITION_DATA 
-            WHERE BENEFICIARY_ID = {beneficiary_id}
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-            GROUP BY BENEFICIARY_ID, FIRST_NAMES, LAST_NAME, HOUSEHOLD, SITE
-        ),
-        latest_measurement AS (
-            SELECT 
-                BENEFICIARY_ID,
-                WHO_INDEX as latest_z_score,
-                ANSWER as latest_height,
-                ROW_NUMBER() OVER (ORDER BY CAPTURE_DATE DESC) as rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE BENEFICIARY_ID = {beneficiary_id}
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-        )
-        SELECT 
-            cs.BENEFICIARY_ID,
-            cs.FIRST_NAMES,
-            cs.LAST_NAME,
-            cs.HOUSEHOLD,
-            cs.SITE,
-            cs.total_measurements,
-            cs.first_measurement_date,
-            cs.last_measurement_date,
-            cs.age_years,
-            cs.avg_z_score,
-            cs.height_gain_cm,
-            lm.latest_z_score,
-            lm.latest_height
-        FROM child_summary cs
-        LEFT JOIN latest_measurement lm ON cs.BENEFICIARY_ID = lm.BENEFICIARY_ID AND lm.rn = 1
-        """
-        
-        df = db.execute_query(query)
+        df = _children_measurements(tuple(beneficiary_ids))
         
         if df.empty:
             return {}
         
-        row = df.iloc[0]
-        
-        # Format child name
-        first_name = row['FIRST_NAMES'] if pd.notna(row['FIRST_NAMES']) else ""
-        last_name = row['LAST_NAME'] if pd.notna(row['LAST_NAME']) else ""
-        full_name = f"{first_name} {last_name}".strip()
+        profiles = _profiles_from_measurements(df)
         
-        return {
-            'beneficiary_id': row['BENEFICIARY_ID'],
-            'name': full_name,
-            'first_name': first_name,
-            'last_name': last_name,
-            'household': row['HOUSEHOLD'],
-            'site': row['SITE'],
-            'total_measurements': row['TOTAL_MEASUREMENTS'],
-            'first_measurement_date': row['FIRST_MEASUREMENT_DATE'],
-            'last_measurement_date': row['LAST_MEASUREMENT_DATE'],
-            'age_years': row['AGE_YEARS'],
-            'avg_z_score': row['AVG_Z_SCORE'],
-            'latest_z_score': row['LATEST_Z_SCORE'],
-            'latest_height': row['LATEST_HEIGHT'],
-            'height_gain_cm': row['HEIGHT_GAIN_CM']
-        }
+        return {record['beneficiary_id']: record for record in profiles.to_dict(orient='records')}
         
     except Exception as e:
-        print(f"Error in get_child_profile_data: {e}")
+        print(f"Error in get_children_profile_data: {e}")
         return {}
 
+def get_child_profile_data(beneficiary_id: int) -> Dict:
+    """
+    Get comprehensive profile data for a specific child.
+    
+    Args:
+        beneficiary_id: Child's beneficiary ID
+    
+    Returns:
+        Dictionary with child profile information
+    """
+    # Shares the cached measurement fetch with the other child page views
+    return get_children_profile_data([beneficiary_id]).get(beneficiary_id, {})
+
 def get_child_progress_metrics(beneficiary_id: int) -> Dict:
     """
     Get progress metrics for a specific child.
@@ -1053,76 +1164,22 @@ def get_child_progress_metrics(beneficiary_id: int) -> Dict:
     Returns:
         Dictionary with progress metrics
     """
-    db = get_database()
-    
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        query = f"""
-        WITH child_summary AS (
-            SELECT 
-                MAX(ANSWER) - MIN(ANSWER) as height_gain_cm,
-                ROUND(AVG(WHO_INDEX), 2) as avg_z_score,
-                ROUND(DATEDIFF(month, MIN(CAPTURE_DATE), MAX(CAPTURE_DATE)), 1) as monitoring_months
-            FROM CHILD_NUTRITION_DATA 
-            WHERE BENEFICIARY_ID = {beneficiary_id}
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-        ),
-        first_last_measurements AS (
-            SELECT 
-                FIRST_VALUE(WHO_INDEX) OVER (ORDER BY CAPTURE_DATE) as first_z_score,
-                FIRST_VALUE(WHO_INDEX) OVER (ORDER BY CAPTURE_DATE DESC) as last_z_score,
-                FIRST_VALUE(ANSWER) OVER (ORDER BY CAPTURE_DATE) as first_height,
-                FIRST_VALUE(ANSWER) OVER (ORDER BY CAPTURE_DATE DESC) as last_height,
-                ROW_NUMBER() OVER (ORDER BY CAPTURE_DATE) as first_rn,
-                ROW_NUMBER() OVER (ORDER BY CAPTURE_DATE DESC) as last_rn
-            FROM CHILD_NUTRITION_DATA 
-            WHERE BENEFICIARY_ID = {beneficiary_id}
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-        )
-        SELECT 
-            cs.height_gain_cm,
-            cs.avg_z_score,
-            cs.monitoring_months,
-            flm.first_z_score,
-            flm.last_z_score,
-            flm.first_height,
-            flm.last_height,
-            flm.last_z_score - flm.first_z_score as z_score_improvement,
-            CASE 
-                WHEN flm.first_z_score >= -1 THEN 'Normal'
-                WHEN flm.first_z_score BETWEEN -2 AND -1 THEN 'At Risk'
-                WHEN flm.first_z_score BETWEEN -3 AND -2 THEN 'Stunted'
-                ELSE 'Severely Stunted'
-            END as first_status,
-            CASE 
-                WHEN flm.last_z_score >= -1 THEN 'Normal'
-                WHEN flm.last_z_score BETWEEN -2 AND -1 THEN 'At Risk'
-                WHEN flm.last_z_score BETWEEN -3 AND -2 THEN 'Stunted'
-                ELSE 'Severely Stunted'
-            END as last_status
-        FROM child_summary cs
-        CROSS JOIN (
-            SELECT 
-                MAX(CASE WHEN first_rn = 1 THEN first_z_score END) as first_z_score,
-                MAX(CASE WHEN last_rn = 1 THEN last_z_score END) as last_z_score,
-                MAX(CASE WHEN first_rn = 1 THEN first_height END) as first_height,
-                MAX(CASE WHEN last_rn = 1 THEN last_height END) as last_height
-            FROM first_last_measurements
-        ) flm
-        """
-        
-        df = db.execute_query(query)
+        df = _child_bundle(beneficiary_id)
         
         if df.empty:
             return {}
         
-        row = df.iloc[0]
+        # First-measurement values come from the whole-history columns, since
+        # the fetch may not reach back to a long-monitored child's first row
+        last = df.iloc[-1]
+        first_z_score = last['FIRST_WHO_INDEX']
+        first_date = pd.to_datetime(last['FIRST_CAPTURE_DATE'])
+        last_date = pd.to_datetime(last['CAPTURE_DATE'])
         
         # Determine alert type based on status changes
-        first_status = row['FIRST_STATUS']
-        last_status = row['LAST_STATUS']
+        first_status = _classify_z_scores(pd.Series([first_z_score]))[0]
+        last_status = last['STATUS']
         
         if first_status != 'Normal' and last_status == 'Normal':
             alert_type = 'SUCCESS'
@@ -1134,14 +1191,15 @@ def get_child_progress_metrics(beneficiary_id: int) -> Dict:
             alert_type = 'NORMAL'
         
         return {
-            'height_gain_cm': row['HEIGHT_GAIN_CM'],
-            'z_score_improvement': row['Z_SCORE_IMPROVEMENT'],
-            'avg_z_score': row['AVG_Z_SCORE'],
-            'monitoring_months': row['MONITORING_MONTHS'],
-            'first_z_score': row['FIRST_Z_SCORE'],
-            'last_z_score': row['LAST_Z_SCORE'],
-            'first_height': row['FIRST_HEIGHT'],
-            'last_height': row['LAST_HEIGHT'],
+            'height_gain_cm': last['HEIGHT_GAIN_CM'],
+            'z_score_improvement': last['WHO_INDEX'] - first_z_score,
+            'avg_z_score': round(last['AVG_Z_SCORE'], 2),
+            # Calendar month boundaries crossed, as DATEDIFF(month, ...)
+            'monitoring_months': (last_date.year - first_date.year) * 12 + (last_date.month - first_date.month),
+            'first_z_score': first_z_score,
+            'last_z_score': last['WHO_INDEX'],
+            'first_height': last['FIRST_ANSWER'],
+            'last_height': last['ANSWER'],
             'first_status': first_status,
             'last_status': last_status,
             'alert_type': alert_type
@@ -1151,171 +1209,159 @@ def get_child_progress_metrics(beneficiary_id: int) -> Dict:
         print(f"Error in get_child_progress_metrics: {e}")
         return {}
 
-def get_child_growth_trajectory(beneficiary_id: int) -> List[Dict]:
+def _downsample(df: pd.DataFrame, limit: int) -> pd.DataFrame:
+    """
+    Thin already-fetched rows to at most limit evenly spaced points for plotting,
+    always including the first and last.
+    """
+    if limit <= 0 or len(df) <= limit:
+        return df
+    positions = np.unique(np.linspace(0, len(df) - 1, limit).round().astype(int))
+    return df.iloc[positions]
+
+def get_child_growth_trajectory_df(beneficiary_id: int, limit: int = 500) -> pd.DataFrame:
     """
     Get height growth trajectory data for a specific child.
     
     Args:
         beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of points to plot, evenly spaced over the
+            fetched measurements
     
     Returns:
-        List of dictionaries with measurement data over time
+        DataFrame with date, height_cm, z_score and age_years columns
     """
-    db = get_database()
-    
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        query = f"""
-        SELECT 
-            CAPTURE_DATE,
-            ANSWER as height_cm,
-            WHO_INDEX,
-            ROUND(DATEDIFF(day, 
-                (SELECT MIN(CAPTURE_DATE) FROM CHILD_NUTRITION_DATA WHERE BENEFICIARY_ID = {beneficiary_id}), 
-                CAPTURE_DATE) / 365.25, 1) as age_years
-        FROM CHILD_NUTRITION_DATA 
-        WHERE BENEFICIARY_ID = {beneficiary_id}
-            AND FLAGGED = 0 AND DUPLICATE = 'False'
-        ORDER BY CAPTURE_DATE
-        """
+        df = _child_bundle(beneficiary_id)
         
-        df = db.execute_query(query)
+        if df.empty:
+            return pd.DataFrame()
         
-        trajectory = []
-        for _, row in df.iterrows():
-            trajectory.append({
-                'date': row['CAPTURE_DATE'],
-                'height_cm': row['HEIGHT_CM'],
-                'z_score': row['WHO_INDEX'],
-                'age_years': row['AGE_YEARS']
-            })
+        df = _downsample(df, limit)
         
-        return trajectory
+        return pd.DataFrame({
+            'date': df['CAPTURE_DATE'],
+            'height_cm': df['ANSWER'],
+            'z_score': df['WHO_INDEX'],
+            'age_years': df['AGE_YEARS']
+        })
         
     except Exception as e:
-        print(f"Error in get_child_growth_trajectory: {e}")
-        return []
+        print(f"Error in get_child_growth_trajectory_df: {e}")
+        return pd.DataFrame()
 
-def get_child_z_score_progression(beneficiary_id: int) -> List[Dict]:
+def get_child_growth_trajectory(beneficiary_id: int, limit: int = 500) -> List[Dict]:
     """
-    Get z-score progression data for a specific child.
+    Get height growth trajectory data for a specific child.
     
     Args:
         beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of points to plot, evenly spaced over the
+            fetched measurements
     
     Returns:
-        List of dictionaries with z-score data over time
+        List of dictionaries with measurement data over time
     """
-    db = get_database()
+    return get_child_growth_trajectory_df(beneficiary_id, limit).to_dict(orient='records')
+
+def get_child_z_score_progression_df(beneficiary_id: int, limit: int = 500) -> pd.DataFrame:
+    """
+    Get z-score progression data for a specific child.
     
+    Args:
+        beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of points to plot, evenly spaced over the
+            fetched measurements
+    
+    Returns:
+        DataFrame with date, z_score and age_years columns
+    """
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        query = f"""
-        SELECT 
-            CAPTURE_DATE,
-            WHO_INDEX,
-            ROUND(DATEDIFF(day, 
-                (SELECT MIN(CAPTURE_DATE) FROM CHILD_NUTRITION_DATA WHERE BENEFICIARY_ID = {beneficiary_id}), 
-                CAPTURE_DATE) / 365.25, 1) as age_years
-        FROM CHILD_NUTRITION_DATA 
-        WHERE BENEFICIARY_ID = {beneficiary_id}
-            AND FLAGGED = 0 AND DUPLICATE = 'False'
-        ORDER BY CAPTURE_DATE
-        """
+        df = _child_bundle(beneficiary_id)
         
-        df = db.execute_query(query)
+        if df.empty:
+            return pd.DataFrame()
         
-        progression = []
-        for _, row in df.iterrows():
-            progression.append({
-                'date': row['CAPTURE_DATE'],
-                'z_score': row['WHO_INDEX'],
-                'age_years': row['AGE_YEARS']
-            })
+        df = _downsample(df, limit)
         
-        return progression
+        return pd.DataFrame({
+            'date': df['CAPTURE_DATE'],
+            'z_score': df['WHO_INDEX'],
+            'age_years': df['AGE_YEARS']
+        })
         
     except Exception as e:
-        print(f"Error in get_child_z_score_progression: {e}")
-        return []
+        print(f"Error in get_child_z_score_progression_df: {e}")
+        return pd.DataFrame()
 
-def get_child_measurement_history(beneficiary_id: int) -> List[Dict]:
+def get_child_z_score_progression(beneficiary_id: int, limit: int = 500) -> List[Dict]:
     """
-    Get detailed measurement history for a specific child.
+    Get z-score progression data for a specific child.
     
     Args:
         beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of points to plot, evenly spaced over the
+            fetched measurements
     
     Returns:
-        List of dictionaries with measurement history
+        List of dictionaries with z-score data over time
     """
-    db = get_database()
+    return get_child_z_score_progression_df(beneficiary_id, limit).to_dict(orient='records')
+
+def get_child_measurement_history_df(beneficiary_id: int, limit: int = 500) -> pd.DataFrame:
+    """
+    Get detailed measurement history for a specific child.
     
+    Args:
+        beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of rows to show; the most recent fetched
+            measurements are kept
+    
+    Returns:
+        DataFrame with date, age_years, height_cm, z_score, status and
+        change columns
+    """
     try:
-        if not db.test_connection():
-            raise Exception("Database connection test failed")
-        
-        query = f"""
-        WITH measurements_with_change AS (
-            SELECT 
-                CAPTURE_DATE,
-                ANSWER as height_cm,
-                WHO_INDEX,
-                ROUND(DATEDIFF(day, 
-                    (SELECT MIN(CAPTURE_DATE) FROM CHILD_NUTRITION_DATA WHERE BENEFICIARY_ID = {beneficiary_id}), 
-                    CAPTURE_DATE) / 365.25, 1) as age_years,
-                LAG(ANSWER) OVER (ORDER BY CAPTURE_DATE) as prev_height,
-                LAG(WHO_INDEX) OVER (ORDER BY CAPTURE_DATE) as prev_z_score,
-                ROW_NUMBER() OVER (ORDER BY CAPTURE_DATE) as row_num
-            FROM CHILD_NUTRITION_DATA 
-            WHERE BENEFICIARY_ID = {beneficiary_id}
-                AND FLAGGED = 0 AND DUPLICATE = 'False'
-        )
-        SELECT 
-            TO_CHAR(CAPTURE_DATE, 'YYYY-MM-DD') as date,
-            age_years,
-            height_cm,
-            ROUND(WHO_INDEX, 2) as z_score,
-            CASE 
-                WHEN WHO_INDEX >= -1 THEN 'Normal'
-                WHEN WHO_INDEX BETWEEN -2 AND -1 THEN 'At Risk'
-                WHEN WHO_INDEX BETWEEN -3 AND -2 THEN 'Stunted'
-                WHEN WHO_INDEX < -3 THEN 'Severely Stunted'
-            END as status,
-            CASE 
-                WHEN row_num = 1 THEN 'First measurement'
-                ELSE CONCAT(
-                    CASE WHEN height_cm >= prev_height THEN '+' ELSE '' END,
-                    ROUND(height_cm - prev_height, 1), 
-                    ' cm | ',
-                    CASE WHEN WHO_INDEX >= prev_z_score THEN '+' ELSE '' END,
-                    ROUND(WHO_INDEX - prev_z_score, 2),
-                    ' z'
-                )
-            END as change
-        FROM measurements_with_change
-        ORDER BY CAPTURE_DATE
-        """
-        
-        df = db.execute_query(query)
-        
-        history = []
-        for _, row in df.iterrows():
-            history.append({
-                'date': row['DATE'],
-                'age_years': row['AGE_YEARS'],
-                'height_cm': row['HEIGHT_CM'],
-                'z_score': row['Z_SCORE'],
-                'status': row['STATUS'],
-                'change': row['CHANGE']
-            })
+        df = _child_bundle(beneficiary_id)
         
-        return history
+        if df.empty:
+            return pd.DataFrame()
+        
+        # Change since the previous measurement, e.g. "+1.5 cm | -0.12 z"
+        deltas = df[['ANSWER', 'WHO_INDEX']].diff()
+        change = _signed(deltas['ANSWER'], 1) + ' cm | ' + _signed(deltas['WHO_INDEX'], 2) + ' z'
+        # The oldest fetched row is only the child's first measurement when the
+        # fetch covered the whole history; otherwise its predecessor is unknown
+        change.iloc[0] = 'First measurement' if df['TOTAL_MEASUREMENTS'].iloc[0] <= len(df) else None
+        # A missing height or z-score leaves the change empty, as CONCAT with NULL did
+        change = change.astype(object).where(change.notna(), None)
+        
+        history = pd.DataFrame({
+            'date': df['DATE'],
+            'age_years': df['AGE_YEARS'],
+            'height_cm': df['ANSWER'],
+            'z_score': df['WHO_INDEX'].round(2),
+            'status': df['STATUS'].astype(object),
+            'change': change
+        })
+        
+        # Changes are computed over the full history before trimming
+        return history.tail(limit) if limit > 0 else history
         
     except Exception as e:
-        print(f"Error in get_child_measurement_history: {e}")
-        return []
+        print(f"Error in get_child_measurement_history_df: {e}")
+        return pd.DataFrame()
+
+def get_child_measurement_history(beneficiary_id: int, limit: int = 500) -> List[Dict]:
+    """
+    Get detailed measurement history for a specific child.
+    
+    Args:
+        beneficiary_id: Child's beneficiary ID
+        limit: Maximum number of rows to show; the most recent fetched
+            measurements are kept
+    
+    Returns:
+        List of dictionaries with measurement history
+    """
+    return get_child_measurement_history_df(beneficiary_id, limit).to_dict(orient='records')
@@ -5,11 +5,14 @@ Handles Snowflake database connectivity with connection pooling and error handli
 
 import streamlit as st
 import snowflake.connector
-from snowflake.connector import DictCursor
+from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.errors import NotSupportedError
 import pandas as pd
 import logging
 from typing import Optional, Dict, Any, List
 import time
+import queue
+import threading
 from contextlib import contextmanager
 
 # Configure logging
@@ -19,9 +22,21 @@ logger = logging.getLogger(__name__)
 class DatabaseConnection:
     """Manages Snowflake database connections with pooling and error handling."""
     
-    def __init__(self):
-        """Initialize database connection with configuration from Streamlit secrets."""
-        self.connection = None
+    def __init__(self, pool_size: int = 4):
+        """
+        Initialize database connection with configuration from Streamlit secrets.
+        
+        Args:
+            pool_size: Maximum number of connections held open at once
+        """
+        self.pool_size = pool_size
+        # Idle connections; queries running on different threads each check
+        # out their own connection instead of sharing one
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._created = 0
+        self._lock = threading.Lock()
+        # Set once the first connection has answered a probe query
+        self._validated = False
         self.connection_params = self._get_connection_params()
         
     def _get_connection_params(self) -> Dict[str, Any]:
@@ -43,29 +58,88 @@ class DatabaseConnection:
             logger.error(f"Failed to get connection parameters: {e}")
             raise
     
+    def _create_connection(self):
+        """Open a new Snowflake connection, probing the first one."""
+        logger.info("Creating new Snowflake connection")
+        connection = snowflake.connector.connect(**self.connection_params,
+                                                 client_session_keep_alive=True)
+        logger.info("Successfully connected to Snowflake")
+        
+        # Claim the probe under the lock so concurrent first connections
+        # don't both run it
+        with self._lock:
+            needs_probe = not self._validated
+            self._validated = True
+        
+        if needs_probe:
+            try:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+            except Exception:
+                with self._lock:
+                    self._validated = False
+                connection.close()
+                raise
+        
+        return connection
+    
     def get_connection(self):
-        """Get a database connection from the pool."""
+        """
+        Check out a database connection from the pool.
+        
+        An idle connection is reused when available; otherwise a new one is
+        opened until pool_size connections exist, after which the caller waits
+        for one to be released.
+        """
         try:
-            if self.connection is None or self.connection.is_closed():
-                logger.info("Creating new Snowflake connection")
-                logger.info(f"Connection parameters: {self.connection_params}")
-                self.connection = snowflake.connector.connect(**self.connection_params)
-                logger.info("Successfully connected to Snowflake")
-            
-            return self.connection
+            while True:
+                try:
+                    connection = self._pool.get_nowait()
+                except queue.Empty:
+                    with self._lock:
+                        can_create = self._created < self.pool_size
+                        if can_create:
+                            self._created += 1
+                    
+                    if can_create:
+                        try:
+                            return self._create_connection()
+                        except Exception:
+                            with self._lock:
+                                self._created -= 1
+                            raise
+                    
+                    connection = self._pool.get()
+                
+                if not connection.is_closed():
+                    return connection
+                
+                # Drop connections that were closed while idle
+                with self._lock:
+                    self._created -= 1
         except Exception as e:
             logger.error(f"Failed to get database connection: {e}")
-            logger.error(f"Connection parameters used: {self.connection_params}")
             raise
     
+    def release_connection(self, connection) -> None:
+        """Return a checked-out connection to the pool."""
+        if connection.is_closed():
+            with self._lock:
+                self._created -= 1
+        else:
+            self._pool.put_nowait(connection)
+    
     @contextmanager
-    def get_cursor(self):
+    def get_cursor(self, cursor_class=SnowflakeCursor):
         """Context manager for database cursor with automatic cleanup."""
         connection = None
         cursor = None
         try:
             connection = self.get_connection()
-            cursor = connection.cursor(DictCursor)
+            cursor = connection.cursor(cursor_class)
             yield cursor
         except Exception as e:
             logger.error(f"Database cursor error: {e}")
@@ -73,11 +147,18 @@ class DatabaseConnection:
         finally:
             if cursor:
                 cursor.close()
+            if connection:
+                self.release_connection(connection)
     
     def execute_query(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
         """
         Execute a parameterized query and return results as DataFrame.
         
+        Results are fetched as Arrow batches and converted column by column, so
+        rows are never materialised as Python objects and numeric columns
+        arrive typed. Statements without an Arrow result (e.g. DDL) fall back
+        to a row fetch.
+        
         Args:
             query: SQL query string
             params: Optional parameters for the query
@@ -89,22 +170,16 @@ class DatabaseConnection:
             with self.get_cursor() as cursor:
                 logger.info(f"Executing query: {query[:100]}...")
                 
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
+                cursor.execute(query, params)
                 
-                # Fetch results
-                results = cursor.fetchall()
+                try:
+                    df = cursor.fetch_pandas_all()
+                except NotSupportedError:
+                    columns = [column[0] for column in cursor.description or []]
+                    df = pd.DataFrame(cursor.fetchall(), columns=columns)
                 
-                if results:
-                    # Convert to DataFrame
-                    df = pd.DataFrame(results)
-                    logger.info(f"Query returned {len(df)} rows")
-                    return df
-                else:
-                    logger.info("Query returned no results")
-                    return pd.DataFrame()
+                logger.info(f"Query returned {len(df)} rows")
+                return df
                     
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
@@ -197,45 +272,59 @@ class DatabaseConnection:
             FLAGGED,
             DUPLICATE
         FROM CHILD_NUTRITION_DATA 
-        WHERE FLAGGED = 0 AND DUPLICATE = 'False'
+        WHERE FLAGGED = 0 AND DUPLICATE = FALSE
         LIMIT {limit}
         """
         return self.execute_query(query)
     
     def close_connection(self):
-        """Close the database connection."""
-        try:
-            if self.connection and not self.connection.is_closed():
-                self.connection.close()
-                logger.info("Database connection closed")
-        except Exception as e:
-            logger.error(f"Error closing connection: {e}")
+        """Close all idle database connections in the pool."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            
+            with self._lock:
+                self._created -= 1
+            
+            try:
+                if not connection.is_closed():
+                    connection.close()
+                    logger.info("Database connection closed")
+            except Exception as e:
+                logger.error(f"Error closing connection: {e}")
     
     def __del__(self):
         """Destructor to ensure connection is closed."""
         self.close_connection()
 
-# Global database instance
-_db_instance = None
+# Instance handed out by get_database, tracked so close_all_connections can
+# close it without creating a new one
+_database: Optional[DatabaseConnection] = None
 
+@st.cache_resource
 def get_database() -> DatabaseConnection:
     """
-    Get the global database connection instance.
+    Get the shared database connection instance.
+    
+    Cached as a Streamlit resource so every session and script rerun reuses
+    the same live connection.
     
     Returns:
         DatabaseConnection: Database connection instance
     """
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = DatabaseConnection()
-    return _db_instance
+    global _database
+    _database = DatabaseConnection()
+    return _database
 
 def close_all_connections():
     """Close all database connections."""
-    global _db_instance
-    if _db_instance:
-        _db_instance.close_connection()
-        _db_instance = None
+    global _database
+    if _database is not None:
+        _database.close_connection()
+        _database = None
+    get_database.clear()
 
 # Convenience functions for common operations
 def execute_query(query: str, params: Optional[Dict] = None) -> pd.DataFrame: